@@ -8,5 +8,6 @@ module.exports = {
   testMatch: ['**/__tests__/**/*.test.[jt]s?(x)'],
   moduleNameMapper: {
     '^expo$': '<rootDir>/__mocks__/expo.js',
+    '^@/(.*)$': '<rootDir>/src/$1',
   },
 };
@@ -1,112 +1,530 @@
 #!/usr/bin/env python3
 """
 Script to add hitSlop prop to all IconButton components
+
+Each file is read once, gets the HIT_SLOP import and any missing hitSlop
+props in memory, and is written back once. Imports and JSX tags are located
+structurally (whole import statements, brace-aware tag ends), so multi-line
+imports and arrow-function props are never split, and HIT_SLOP ends up
+imported exactly once.
 """
 
+import argparse
+import bisect
+import hashlib
+import itertools
+import json
+import mmap
 import os
 import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-SRC_DIR = Path("/mnt/d/claude dash/jarvis-native/src")
-
-# Files that already have HIT_SLOP (skip these)
-SKIP_FILES = {
-    "src/components/ProjectCard.tsx",
-    "src/components/ui/SearchBar.tsx",
-    "src/screens/main/HabitsScreen.tsx",
-    "src/screens/main/TasksScreen.tsx",
-    "src/components/BudgetCard.tsx",
-    "src/components/BudgetFormModal.tsx",
-}
-
-def get_relative_import(file_path):
-    """Calculate relative import path for constants/ui"""
-    rel_parts = os.path.relpath(SRC_DIR / "constants/ui.ts", file_path.parent)
-    # Remove .ts extension and convert to proper import
-    rel_parts = rel_parts.replace(".ts", "").replace("\\", "/")
-    if not rel_parts.startswith("."):
-        rel_parts = "./" + rel_parts
-    return rel_parts
-
-def process_file(file_path):
-    """Add HIT_SLOP import and hitSlop props to IconButtons"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Skip if no IconButton
-    if 'IconButton' not in content or 'react-native-paper' not in content:
+try:
+    import xxhash
+except ImportError:  # optional: faster hashing for the incremental cache
+    xxhash = None
+
+# The repository this script lives in
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Defaults to the src/ next to this scripts/ directory; see configure()
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Resolved through the "@/*" -> "src/*" alias in tsconfig.json, so the same
+# line works in every directory
+UI_MODULE = "@/constants/ui"
+IMPORT_STATEMENT = f"import {{ HIT_SLOP }} from '{UI_MODULE}';"
+
+# Where UI_MODULE points, for recognising relative imports of it
+UI_MODULE_PATH = os.path.join(str(PROJECT_ROOT), "src", "constants", "ui")
+
+# Per-file outcomes reported by transform_file()
+MODIFIED = "modified"
+NOOP = "noop"
+SKIP = "skip"
+
+# Content hashes from the previous run, so untouched files are skipped. Kept
+# at the project root whichever directory is processed; keys are absolute
+CACHE_PATH = PROJECT_ROOT / ".hitslop_cache.json"
+
+# Walked paths all start with this, so reports can slice it off
+DISPLAY_PREFIX = os.path.join(str(SRC_DIR.parent), "")
+
+# Directories never worth walking into
+PRUNE_DIRS = {"node_modules", ".git", "build", "ios", "android"}
+
+# Compiled once and shared by every file
+# Props of a JSX tag: comments, quoted values and {...} expressions (nested up
+# to three levels) are consumed whole, so a '>' inside an arrow function or a
+# comment is not the end. Comments can only match whole, so backtracking
+# cannot split one and read a quote inside it as a string
+_JSX_PROPS = (
+    r"""(?://[^\n]*(?![^\n])|/\*(?:[^*]|\*(?!/))*\*/|[^<>{}"'/]|/(?![/*])|"[^"]*"|'[^']*'"""
+    r"""|\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\})*?"""
+)
+# Only IconButtons without a hitSlop prop; the lookahead lets the regex
+# engine pass over tags that are already done
+_ICONBUTTON_RE = re.compile(r'<IconButton\b(?!' + _JSX_PROPS + r'\bhitSlop\s*=)')
+# Fast path for finding where an IconButton's props end
+_TAG_PROPS_RE = re.compile(_JSX_PROPS + r'(?=/?>)')
+_HITSLOP_PROP_RE = re.compile(r'\bhitSlop\s*=')
+_HITSLOP_NAME_RE = re.compile(r'\bHIT_SLOP\b')
+# A top-level declaration of the name, which must not be shadowed by an import
+_LOCAL_HITSLOP_RE = re.compile(
+    r'^(?:export\s+)?(?:const|let|var|function|class)\s+HIT_SLOP\b', re.MULTILINE,
+)
+# Leading comments and directive prologue ('use client'; 'use dom'; ...);
+# ends right after the last of them, before any trailing whitespace
+_PROLOGUE_RE = re.compile(
+    r"""(?:\s*(?://[^\n]*|/\*.*?\*/|(['"])[^'"\n]*\1[ \t]*;?))*""",
+    re.DOTALL,
+)
+# Whitespace and comments between statements
+_TRIVIA_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+# One import statement, up to its module specifier; comments in the bindings
+# are consumed whole so quotes inside them are ignored
+_IMPORT_STMT_RE = re.compile(
+    r"""import\b(?!\s*[(.])(?:[^'"/]|//[^\n]*|/\*.*?\*/)*?(['"])[^'"\n]*\1;?""",
+    re.DOTALL,
+)
+_TYPE_IMPORT_RE = re.compile(r'import\s+type\b')
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+# Comments and string literals, so comment markers inside strings are not
+# mistaken for comments and names inside either are not mistaken for code
+_CODE_TOKEN_RE = re.compile(
+    r"""//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`""",
+    re.DOTALL,
+)
+# The bindings between "import" and "from"; side-effect imports have none
+_IMPORT_CLAUSE_RE = re.compile(r"""import\s+(.*?)\s*\bfrom\s*['"]""", re.DOTALL)
+_NAMED_BINDINGS_RE = re.compile(r'\{([^{}]*)\}')
+# One named specifier: optional "type" modifier, imported name, optional alias
+_BINDING_RE = re.compile(r'(type\s+)?([\w$]+)(?:\s+as\s+([\w$]+))?')
+_IDENTIFIER_RE = re.compile(r'[\w$]+')
+_SPECIFIER_RE = re.compile(r"""(['"])([^'"]*)\1;?$""")
+_HITSLOP_ONLY_RE = re.compile(r"""import\s*\{\s*HIT_SLOP\s*,?\s*\}\s*from\s*['"][^'"]*['"];?""")
+_NAMED_LIST_RE = re.compile(r'\{([^{}\n]*?)\s*,?\s*\}')
+_PROP_INDENT_RE = re.compile(r'\n([ \t]*)\S')
+
+def scan_imports(content):
+    """Return the import statements heading content as (start, end, text)
+
+    Whitespace/comment runs and whole import statements are each matched by
+    a single compiled regex, so the header is consumed in one pass over the
+    raw string and the scan stops at the first token that is not an import.
+    Directives such as 'use client'; ahead of the imports are skipped.
+    """
+    statements = []
+    pos = _TRIVIA_RE.match(content, _PROLOGUE_RE.match(content).end()).end()
+    while True:
+        match = _IMPORT_STMT_RE.match(content, pos)
+        if not match:
+            break
+        statements.append((match.start(), match.end(), match.group()))
+        pos = _TRIVIA_RE.match(content, match.end()).end()
+    return statements
+
+def provides_hit_slop(statement):
+    """Return True if an import statement binds the local value name HIT_SLOP
+
+    Comments and aliased imports (HIT_SLOP as HS) do not count; a specifier
+    renamed to it (X as HIT_SLOP), a default or a namespace import does.
+    """
+    if _TYPE_IMPORT_RE.match(statement):
+        return False
+    clause = _IMPORT_CLAUSE_RE.match(_COMMENT_RE.sub(' ', statement))
+    if not clause:
         return False
+    clause = clause.group(1)
+
+    named = _NAMED_BINDINGS_RE.search(clause)
+    if named:
+        for specifier in named.group(1).split(','):
+            binding = _BINDING_RE.fullmatch(specifier.strip())
+            if binding and not binding.group(1) and (binding.group(3) or binding.group(2)) == 'HIT_SLOP':
+                return True
+        clause = clause[:named.start()] + clause[named.end():]
 
-    # Skip if already has HIT_SLOP
-    if 'HIT_SLOP' in content:
-        print(f"SKIP (has HIT_SLOP): {file_path.relative_to(SRC_DIR.parent)}")
+    # What is left is the default and/or "* as name" namespace binding
+    return 'HIT_SLOP' in _IDENTIFIER_RE.findall(clause)
+
+def is_ui_module(specifier, file_dir=None):
+    """Return True if specifier names the module HIT_SLOP is imported from
+
+    Relative specifiers are resolved against file_dir, the directory of the
+    importing file; without it only the alias is recognised.
+    """
+    if specifier == UI_MODULE:
+        return True
+    if file_dir is None or not specifier.startswith('.'):
         return False
+    return os.path.normpath(os.path.join(file_dir, specifier)) == UI_MODULE_PATH
+
+def remove_statement_line(content, start, end):
+    """Drop the line holding content[start:end] if nothing else is on it"""
+    line_start = content.rfind('\n', 0, start) + 1
+    eol = content.find('\n', end)
+    eol = len(content) if eol < 0 else eol + 1
+    if content[line_start:start].strip() or content[end:eol].strip():
+        return content
+    return content[:line_start] + content[eol:]
+
+def merge_named_import(statement):
+    """Add HIT_SLOP to a single-line named import list, or return None"""
+    match = _NAMED_LIST_RE.search(statement)
+    if not match:
+        return None
+    names = match.group(1)
+    if not names.strip():
+        return f"{statement[:match.start()]}{{ HIT_SLOP }}{statement[match.end():]}"
+    closing = ' }' if names.startswith(' ') else '}'
+    return f"{statement[:match.start()]}{{{names}, HIT_SLOP{closing}{statement[match.end():]}"
+
+def find_tag_end(content, pos):
+    """Return the offset of the '>' or '/>' closing the JSX tag opened before pos
+
+    Comments, quoted attribute values and {...} expressions are skipped, so
+    props like onPress={() => ...} or a "// don't" comment do not end the
+    tag early or desync the walk.
+    """
+    depth = 0
+    quote = None
+    i = pos
+    while i < len(content):
+        ch = content[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif content.startswith('//', i):
+            i = content.find('\n', i)
+            if i < 0:
+                return -1
+        elif content.startswith('/*', i):
+            i = content.find('*/', i + 2)
+            if i < 0:
+                return -1
+            i += 1
+        elif ch in '"\'`':
+            quote = ch
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+        elif depth == 0 and (ch == '>' or content.startswith('/>', i)):
+            return i
+        i += 1
+    return -1
+
+def comment_spans(content):
+    """Return the (starts, ends) offsets of the comments in content, in order"""
+    spans = [m.span() for m in _CODE_TOKEN_RE.finditer(content) if m.group()[0] == '/']
+    return [start for start, _ in spans], [end for _, end in spans]
+
+def add_hitslop_prop(tag):
+    """Append hitSlop={HIT_SLOP} to the props of an IconButton tag"""
+    body = tag.rstrip()
+    trailing = tag[len(body):]
 
-    modified = False
+    if '\n' not in body:
+        return f"{body} hitSlop={{HIT_SLOP}}{trailing}"
 
-    # Add import
-    import_path = get_relative_import(file_path)
-    import_statement = f"import {{ HIT_SLOP }} from '{import_path}';"
+    # Multi-line tag: line the new prop up with the existing ones
+    indent = _PROP_INDENT_RE.search(body).group(1)
+    return f"{body}\n{indent}hitSlop={{HIT_SLOP}}{trailing}"
 
-    # Find last import line
-    lines = content.split('\n')
-    last_import_idx = -1
-    for i, line in enumerate(lines):
-        if line.strip().startswith('import '):
-            last_import_idx = i
+def write_atomic(file_path, data):
+    """Write data next to file_path, then swap it into place
 
-    if last_import_idx >= 0:
-        lines.insert(last_import_idx + 1, import_statement)
-        content = '\n'.join(lines)
-        modified = True
+    The file keeps its permission bits, and the temporary file is removed
+    if anything fails before the swap.
+    """
+    tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        if file_path.exists():
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
-    # Add hitSlop to IconButton components that don't have it
-    # Match IconButton with any props, check if it doesn't have hitSlop
-    pattern = r'(<IconButton[^>]*?)(/?>)'
+def add_hitslop_props(content):
+    """Add hitSlop to IconButton components that don't have it
 
-    def add_hitslop(match):
-        tag = match.group(1)
-        closing = match.group(2)
+    >>> add_hitslop_props('<IconButton icon="x" /* a > b */ onPress={f} />')
+    '<IconButton icon="x" /* a > b */ onPress={f} hitSlop={HIT_SLOP} />'
+    >>> add_hitslop_props('<IconButton /* a > b */ hitSlop={HIT_SLOP} />')
+    '<IconButton /* a > b */ hitSlop={HIT_SLOP} />'
+    >>> add_hitslop_props("<IconButton // don't > stop\\n  onPress={() => { a(() => { b(() => { c(); }); }); }} />")
+    "<IconButton // don't > stop\\n  onPress={() => { a(() => { b(() => { c(); }); }); }}\\n  hitSlop={HIT_SLOP} />"
+    >>> add_hitslop_props('{/* <IconButton icon="old" /> */}<IconButton hitSlop={{top:1}} />')
+    '{/* <IconButton icon="old" /> */}<IconButton hitSlop={{top:1}} />'
+    """
+    parts = []
+    last = 0
+    starts, ends = comment_spans(content)
+    for match in _ICONBUTTON_RE.finditer(content):
+        # Commented-out tags are left alone
+        i = bisect.bisect_right(starts, match.start()) - 1
+        if i >= 0 and match.start() < ends[i]:
+            continue
+        props = _TAG_PROPS_RE.match(content, match.end())
+        if props:
+            end = props.end()
+        else:
+            # Props nested deeper than _JSX_PROPS follows: walk them by hand,
+            # and since the lookahead could not see past them, recheck hitSlop
+            end = find_tag_end(content, match.end())
+            if end < 0:
+                break
+            if _HITSLOP_PROP_RE.search(content, match.start(), end):
+                continue
+        parts.append(content[last:match.start()])
+        parts.append(add_hitslop_prop(content[match.start():end]))
+        last = end
+    parts.append(content[last:])
+    return ''.join(parts)
+
+def ensure_hitslop_import(content, file_dir=None):
+    """Make sure HIT_SLOP is imported exactly once if the file uses it
+
+    Files that declare HIT_SLOP themselves are left as they are.
+
+    >>> print(ensure_hitslop_import("'use client';\\nx(HIT_SLOP);\\n"))
+    'use client';
+    import { HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("'use client';\\nimport { View } from 'react-native';\\nx(HIT_SLOP);\\n"))
+    'use client';
+    import { View } from 'react-native';
+    import { HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("import {} from '@/constants/ui';\\nx(HIT_SLOP);\\n"))
+    import { HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("import { HIT_SLOP as HS } from '@/constants/ui';\\nx(HIT_SLOP);\\n"))
+    import { HIT_SLOP as HS, HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("import type { Spacing } from '@/constants/ui';\\nx(HIT_SLOP);\\n"))
+    import type { Spacing } from '@/constants/ui';
+    import { HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import(
+    ...     "import { HIT_SLOP } from '@/constants/ui';\\n"
+    ...     "import { HIT_SLOP } from '../constants/ui';\\n"
+    ...     "x(HIT_SLOP);\\n"
+    ... ))
+    import { HIT_SLOP } from '@/constants/ui';
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("const HIT_SLOP = { top: 8 };\\nx(HIT_SLOP);\\n"))
+    const HIT_SLOP = { top: 8 };
+    x(HIT_SLOP);
+    <BLANKLINE>
+    >>> print(ensure_hitslop_import("import { View } from 'react-native';\\n{/* <IconButton hitSlop={HIT_SLOP} /> */}\\n"))
+    import { View } from 'react-native';
+    {/* <IconButton hitSlop={HIT_SLOP} /> */}
+    <BLANKLINE>
+    """
+    if _LOCAL_HITSLOP_RE.search(content):
+        return content
+
+    statements = scan_imports(content)
+    providers = [stmt for stmt in statements if provides_hit_slop(stmt[2])]
+
+    if providers:
+        # Drop standalone duplicates, keeping the first import that binds it
+        for start, end, text in reversed(providers[1:]):
+            if _HITSLOP_ONLY_RE.fullmatch(text):
+                content = remove_statement_line(content, start, end)
+        return content
+
+    # With no imports, the new one goes after any leading comments/directives
+    header_end = statements[-1][1] if statements else _PROLOGUE_RE.match(content).end()
+    # Mentions in comments or strings don't need the import
+    if not _HITSLOP_NAME_RE.search(_CODE_TOKEN_RE.sub(' ', content[header_end:])):
+        return content
+
+    # Extend an existing value import of constants/ui rather than adding one
+    for start, end, text in statements:
+        specifier = _SPECIFIER_RE.search(text).group(2)
+        if is_ui_module(specifier, file_dir) and not _TYPE_IMPORT_RE.match(text):
+            merged = merge_named_import(text)
+            if merged:
+                return f"{content[:start]}{merged}{content[end:]}"
+
+    if header_end == 0:
+        return f"{IMPORT_STATEMENT}\n{content}"
+    eol = content.find('\n', header_end)
+    eol = len(content) if eol < 0 else eol
+    return f"{content[:eol]}\n{IMPORT_STATEMENT}{content[eol:]}"
+
+def unified_pass(content, file_dir=None):
+    """Apply every hitSlop fix to content in memory and return the result"""
+    content = add_hitslop_props(content)
+    if 'HIT_SLOP' not in content:
+        return content
+    return ensure_hitslop_import(content, file_dir)
+
+def iter_tsx(root):
+    """Yield paths of .tsx files under root as plain strings
+
+    Uses os.scandir so directory entries are filtered without building Path
+    objects, and never descends into dependency or build directories.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in PRUNE_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.tsx'):
+                    yield entry.path
+
+def content_hash(data):
+    """Hash file bytes for the incremental cache"""
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
 
-        # Skip if already has hitSlop
-        if 'hitSlop' in tag:
-            return match.group(0)
+def cache_version():
+    """Identify the transform, so hashes recorded by other logic are dropped"""
+    with open(__file__, 'rb') as f:
+        return content_hash(f.read())
 
-        # Add hitSlop before closing
-        return f"{tag}\n                hitSlop={{HIT_SLOP}}{closing}"
+def load_cache(version):
+    """Read the path -> content hash map written by the previous run
 
-    new_content = re.sub(pattern, add_hitslop, content, flags=re.DOTALL)
+    Returns an empty map if the file is missing, malformed, or was written
+    by a different version of this script.
+    """
+    try:
+        cache = json.loads(CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != version:
+        return {}
+    hashes = cache.get("hashes")
+    return hashes if isinstance(hashes, dict) else {}
 
-    if new_content != content:
-        modified = True
-        content = new_content
+def transform_file(path, cached_hash=None, write=True):
+    """Add HIT_SLOP import and hitSlop props to IconButtons
 
+    Returns (action, hash): one of MODIFIED, NOOP or SKIP, plus the hash of
+    what is now on disk for the incremental cache. With write=False the file
+    is left alone and MODIFIED means it would have been changed.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return SKIP, content_hash(b'')
+
+        # Map the file so rejected files are hashed and probed without a copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Unchanged since the last run, when it was already up to date
+            digest = content_hash(mm)
+            if digest == cached_hash:
+                return SKIP, digest
+
+            # Skip if no IconButton, probing the raw bytes so misses are never decoded
+            if mm.find(b'IconButton') < 0 or mm.find(b'react-native-paper') < 0:
+                return SKIP, digest
+
+            original = str(mm, 'utf-8')
+
+    content = unified_pass(original, os.path.dirname(path))
+    if content == original:
+        return NOOP, digest
+    if not write:
+        return MODIFIED, digest
+
+    new_data = content.encode('utf-8')
+    write_atomic(Path(path), new_data)
+    return MODIFIED, content_hash(new_data)
+
+def format_report(manifest, dry_run=False):
+    """Render the (rel_path, action) manifest as a sorted, tabular summary"""
+    verb = "Would modify" if dry_run else "Modified"
+    modified = sorted(rel_path for rel_path, action in manifest if action == MODIFIED)
+    counts = {action: 0 for action in (MODIFIED, NOOP, SKIP)}
+    for _, action in manifest:
+        counts[action] += 1
+
+    lines = ["Adding hitSlop to IconButton components...", ""]
+    lines.extend(f"✓ {verb}: {rel_path}" for rel_path in modified)
     if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✓ Modified: {file_path.relative_to(SRC_DIR.parent)}")
-        return True
+        lines.append("")
+    lines.append(f"{'Processed:':<14}{len(manifest):>5} files")
+    lines.append(f"{verb + ':':<14}{counts[MODIFIED]:>5} files")
+    lines.append(f"{'Unchanged:':<14}{counts[NOOP]:>5} files")
+    lines.append(f"{'Skipped:':<14}{counts[SKIP]:>5} files")
+    return '\n'.join(lines) + '\n'
 
-    return False
+def configure(src_dir):
+    """Point SRC_DIR and the paths derived from it at src_dir"""
+    global SRC_DIR, DISPLAY_PREFIX
+    SRC_DIR = src_dir
+    DISPLAY_PREFIX = os.path.join(str(SRC_DIR.parent), "")
 
-def main():
-    """Process all TypeScript files"""
-    print("Adding hitSlop to IconButton components...\n")
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Add hitSlop to IconButton components.")
+    parser.add_argument("src_dir", nargs="?", type=Path, default=SRC_DIR,
+                        help="source directory to process (default: %(default)s)")
+    parser.add_argument("--check", action="store_true",
+                        help="don't write anything; exit 1 if any file would change")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report what would change without writing anything")
+    args = parser.parse_args(argv)
+    if not args.src_dir.is_dir():
+        parser.error(f"{args.src_dir} is not a directory")
+    return args
 
-    processed = 0
-    modified = 0
+def main(argv=None):
+    """Process all TypeScript files, returning the process exit code"""
+    args = parse_args(argv)
+    write = not (args.check or args.dry_run)
+    configure(args.src_dir.resolve())
 
-    for tsx_file in SRC_DIR.rglob("*.tsx"):
-        rel_path = str(tsx_file.relative_to(SRC_DIR.parent))
-        if rel_path in SKIP_FILES:
-            continue
+    files = list(iter_tsx(SRC_DIR))
+
+    version = cache_version()
+    cache = load_cache(version)
+    cached_hashes = [cache.get(path) for path in files]
+
+    # Files are independent, so spread the read/scan/write work across cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(
+            transform_file, files, cached_hashes, itertools.repeat(write), chunksize=32,
+        ))
+
+    if write:
+        # Keep entries for other directories; ones under SRC_DIR that were
+        # not walked this time belong to deleted files
+        prefix = os.path.join(str(SRC_DIR), "")
+        hashes = {path: digest for path, digest in cache.items() if not path.startswith(prefix)}
+        hashes.update((path, digest) for path, (_, digest) in zip(files, results))
+        write_atomic(CACHE_PATH, json.dumps(
+            {"version": version, "hashes": hashes},
+            indent=2, sort_keys=True,
+        ).encode('utf-8'))
 
-        processed += 1
-        if process_file(tsx_file):
-            modified += 1
+    # Nothing is printed from the hot loop; the whole report is one write
+    manifest = [(path[len(DISPLAY_PREFIX):], action) for path, (action, _) in zip(files, results)]
+    sys.stdout.write(format_report(manifest, dry_run=not write))
 
-    print(f"\nProcessed: {processed} files")
-    print(f"Modified: {modified} files")
+    if args.check and any(action == MODIFIED for _, action in manifest):
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())